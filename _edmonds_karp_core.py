@@ -0,0 +1,140 @@
+"""
+The Edmonds-Karp hot loop (BFS + augmentation) as a Cython pure-Python-mode
+module: this exact file runs unmodified on plain CPython, and compiling it
+(see setup.py, gated behind ALGOCOMP_ENABLE_SPEEDUPS) turns the annotated
+loops into C without a separate .pyx source. code_no_plot.py imports from
+here for its non-Numba path; a compiled extension of the same name simply
+shadows this file.
+"""
+
+from array import array
+
+try:
+    import cython
+except ImportError:
+    # Plain CPython without Cython installed: make the decorators and type
+    # namespace vanish so the annotations below cost nothing
+    class _CythonShim:
+        compiled = False
+
+        def __getattr__(self, _name):
+            return self
+
+        def __call__(self, *args, **kwargs):
+            if len(args) == 1 and callable(args[0]) and not kwargs:
+                return args[0]  # used directly as a decorator
+            return self  # used as a decorator factory / type marker
+
+    cython = _CythonShim()
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def bfs(head, nxt, to, cap, source, sink, parent_edge, visited, queue, min_cap=1):
+    """
+    (Step 2b in pseudocode)
+    We search the residual network for any S→T path whose edges all still
+    carry at least min_cap capacity (min_cap=1 means any positive edge).
+    Here, we're using BFS to find the shortest such path (in terms of edges).
+
+    Instead of scanning a whole matrix row per node, we walk only the real
+    edges leaving u via head/nxt. parent_edge[v] records the edge used to
+    reach v so the path can be walked backwards afterwards.
+
+    visited is a bytearray rather than a list of bools: one byte per node in
+    contiguous storage instead of n pointers to boxed objects, so big graphs
+    stay cache-resident and indexing skips the generic list machinery. Both
+    scratch structures are owned by the caller and reused across searches;
+    visited must be all zeros on entry, and the caller clears the marks
+    recorded in queue afterwards instead of memsetting the whole array.
+    """
+    qpos: cython.Py_ssize_t
+    u: cython.Py_ssize_t
+    v: cython.Py_ssize_t
+    e: cython.Py_ssize_t
+
+    queue.clear()
+    queue.append(source)
+    visited[source] = 1
+    parent_edge[source] = -1  # mark the source's parent as undefined
+
+    qpos = 0
+    while qpos < len(queue):
+        u = queue[qpos]
+        qpos += 1
+        # Explore neighbors of u in the residual graph
+        e = head[u]
+        while e != -1:
+            v = to[e]
+            if not visited[v] and cap[e] >= min_cap:
+                parent_edge[v] = e
+                visited[v] = 1
+                queue.append(v)
+                if v == sink:
+                    # (Step 2c) We've found an augmenting path
+                    return True
+            e = nxt[e]
+    # No path found; can't push more flow
+    return False
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def edmonds_karp_core(head, nxt, to, cap, source, sink, delta):
+    """
+    (Steps 2–3 in pseudocode) The full augmenting loop over the flat edge
+    arrays, including the capacity-scaling schedule: repeatedly find the
+    shortest path whose edges carry at least delta, augment along it, and
+    halve delta once no such path is left. Returns the maximum flow.
+    """
+    n: cython.Py_ssize_t = len(head)
+    plen: cython.Py_ssize_t
+    v: cython.Py_ssize_t
+    e: cython.Py_ssize_t
+    i: cython.Py_ssize_t
+
+    # Typed int64 arrays ('q') instead of Python lists: contiguous C storage
+    # with no per-element pointer chasing or boxed-int dispatch
+    parent_edge = array('q', [-1]) * n
+    path_edges = array('q', [0]) * n  # reusable buffer; a path has at most n-1 edges
+    # BFS scratch, allocated once and recycled: after each search the nodes
+    # it marked are exactly the ones left in the queue, so only those bytes
+    # are cleared — O(reach) instead of O(n) per augmentation
+    visited = bytearray(n)
+    queue = []
+    max_flow = 0  # Total flow pushed so far
+
+    # Repeat until no augmenting path remains at the current threshold,
+    # then relax the threshold
+    while delta >= 1:
+        while True:
+            found = bfs(head, nxt, to, cap, source, sink, parent_edge,
+                        visited, queue, delta)
+            for v in queue:
+                visited[v] = 0
+            if not found:
+                break
+            # (Steps 2d+2e fused) One backward walk records the path edges
+            # and the bottleneck together, then the short buffer is replayed
+            # to augment — the parent chain is only pointer-chased once
+            path_flow = cap[parent_edge[sink]]
+            plen = 0
+            v = sink
+            while v != source:
+                e = parent_edge[v]
+                path_edges[plen] = e
+                plen += 1
+                if cap[e] < path_flow:
+                    path_flow = cap[e]
+                v = to[e ^ 1]  # the reverse edge points back at where we came from
+            for i in range(plen):
+                e = path_edges[i]
+                cap[e] -= path_flow      # reduce forward edge capacity
+                cap[e ^ 1] += path_flow  # increase reverse edge (undo flow) capacity
+
+            # Accumulate total flow
+            max_flow += path_flow
+        delta >>= 1
+
+    # Once no more paths exist, return the total maximum flow found
+    return max_flow
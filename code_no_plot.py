@@ -5,34 +5,242 @@ Allows users to input custom graphs via the terminal.
 """
 
 
+import os
+import sys
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
+# The BFS + augmentation hot loop lives in a Cython pure-Python-mode module:
+# it runs as ordinary Python here, and a compiled build (see setup.py)
+# shadows it under the same name for a further speedup without Numba
+from _edmonds_karp_core import bfs, edmonds_karp_core
 
-def bfs(residual, source, sink, parent):
+try:
+    # Optional: when Numba is around, the whole augmenting loop runs as
+    # machine code. The script still works with the stdlib alone.
+    import numpy as np
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+
+def build_residual_arrays(capacity):
     """
-    (Step 2b in pseudocode)
-    We search the residual network for any S→T path with positive capacity.
-    Here, we're using BFS to find the shortest such path (in terms of edges).
+    (Step 1 in pseudocode)
+    Convert the dense capacity matrix into a compact adjacency-list residual
+    graph stored as four flat arrays (the CSR-style layout):
+
+        head[u] -> index of the first edge leaving u (-1 if u has none)
+        nxt[e]  -> index of the next edge sharing e's origin (-1 at the end)
+        to[e]   -> node that edge e points at
+        cap[e]  -> remaining capacity of edge e
+
+    Each forward edge is appended together with its reverse (undo) edge, so
+    the partner of edge e is always e ^ 1. An antiparallel pair of input
+    edges (u→v and v→u both present) shares a single edge pair: the reverse
+    slot simply starts at the real backward capacity instead of 0, since
+    undo capacity and backward capacity are interchangeable in a residual
+    graph. That halves the entries for such pairs and keeps BFS from
+    scanning two half-empty twins.
     """
-    visited = [False] * len(residual)
-    queue = deque([source])
-    visited[source] = True
-    parent[source] = -1  # mark the source's parent as undefined
-
-
-    while queue:
-        u = queue.popleft()
-        # Explore neighbors of u in the residual graph
-        for v, cap in enumerate(residual[u]):
-            if not visited[v] and cap > 0:
-                parent[v] = u
-                visited[v] = True
-                queue.append(v)
-                if v == sink:
-                    # (Step 2c) We've found an augmenting path
-                    return True
-    # No path found; can't push more flow
-    return False
+    n = len(capacity)
+    head = [-1] * n
+    nxt = []
+    to = []
+    cap = []
+    for u in range(n):
+        for v in range(n):
+            c = capacity[u][v]
+            if c > 0:
+                if capacity[v][u] > 0 and v < u:
+                    # Already emitted as the reverse slot of the (v, u) pair
+                    continue
+                # Forward edge u → v with its full capacity
+                to.append(v)
+                cap.append(c)
+                nxt.append(head[u])
+                head[u] = len(to) - 1
+                # Reverse edge v → u: holds the real backward capacity when
+                # the input has one, and grows as forward flow is pushed so
+                # later iterations can undo that flow
+                to.append(u)
+                cap.append(capacity[v][u])
+                nxt.append(head[v])
+                head[v] = len(to) - 1
+    return head, nxt, to, cap
+
+
+if _HAVE_NUMBA:
+    @njit(cache=True, boundscheck=False)
+    def _ek_core(head, nxt, to, cap, source, sink, min_cap):
+        """
+        The Steps 1–3 loop as one typed kernel: BFS over the edge arrays
+        with a preallocated ring buffer instead of a deque, then the
+        bottleneck/augment walks. Only edges with at least min_cap residual
+        capacity are admitted, so the scaling wrapper can call this once per
+        Δ-threshold on the same (mutated in place) capacity array; the
+        return value is the flow pushed during this call. Numba compiles
+        the whole thing to native code, so no boxed Python ints survive
+        into the hot loop.
+        """
+        n = head.shape[0]
+        parent_edge = np.full(n, -1, dtype=np.int64)
+        visited = np.zeros(n, dtype=np.bool_)
+        queue = np.empty(n, dtype=np.int64)
+        path_edges = np.empty(n, dtype=np.int64)  # at most n-1 edges per path
+        max_flow = 0  # Total flow pushed so far
+
+        while True:
+            # (Step 2b) BFS for the shortest augmenting path. parent_edge
+            # needs no reset: it is only ever read for nodes this search
+            # discovers, which overwrite their entries first.
+            visited[source] = True
+            queue[0] = source
+            qhead = 0
+            qtail = 1
+            found = False
+            while qhead < qtail and not found:
+                u = queue[qhead]
+                qhead += 1
+                e = head[u]
+                while e != -1:
+                    v = to[e]
+                    if not visited[v] and cap[e] >= min_cap:
+                        parent_edge[v] = e
+                        visited[v] = True
+                        queue[qtail] = v
+                        qtail += 1
+                        if v == sink:
+                            # (Step 2c) We've found an augmenting path
+                            found = True
+                            break
+                    e = nxt[e]
+            # Clear only the nodes this search marked — they all sit in
+            # queue[:qtail] — so the next search starts from zeros at
+            # O(reach) cost instead of an O(n) memset per augmentation
+            for i in range(qtail):
+                visited[queue[i]] = False
+            if not found:
+                # No path found; can't push more flow
+                break
+
+            # (Steps 2d+2e fused) One backward walk records the path edges
+            # and the bottleneck together — the parent chain is only
+            # pointer-chased once — then the short buffer is replayed to
+            # augment by that amount
+            path_flow = cap[parent_edge[sink]]
+            plen = 0
+            v = sink
+            while v != source:
+                e = parent_edge[v]
+                path_edges[plen] = e
+                plen += 1
+                if cap[e] < path_flow:
+                    path_flow = cap[e]
+                v = to[e ^ 1]
+            for i in range(plen):
+                e = path_edges[i]
+                cap[e] -= path_flow
+                cap[e ^ 1] += path_flow
+
+            # Accumulate total flow
+            max_flow += path_flow
+
+        # (Step 3) Once no more paths exist, return the total maximum flow
+        return max_flow
+
+    @njit(cache=True, boundscheck=False)
+    def _dinic_core(head, nxt, to, cap, source, sink):
+        """
+        Dinic's phase loop as a typed kernel: BFS levels with the early
+        sink-layer cutoff, then an iterative DFS (explicit edge stack
+        instead of recursion, so path length isn't limited by the
+        interpreter's recursion depth) that saturates the level graph
+        using per-node current-arc pointers.
+        """
+        n = head.shape[0]
+        level = np.empty(n, dtype=np.int64)
+        iter_ptr = np.empty(n, dtype=np.int64)
+        queue = np.empty(n, dtype=np.int64)
+        path = np.empty(n, dtype=np.int64)  # edge ids on the current path
+        max_flow = 0
+
+        while True:
+            # Phase BFS: label reachable nodes with their distance
+            for i in range(n):
+                level[i] = -1
+            level[source] = 0
+            queue[0] = source
+            qhead = 0
+            qtail = 1
+            while qhead < qtail:
+                u = queue[qhead]
+                qhead += 1
+                if level[sink] != -1 and level[u] >= level[sink]:
+                    break
+                e = head[u]
+                while e != -1:
+                    v = to[e]
+                    if cap[e] > 0 and level[v] == -1:
+                        level[v] = level[u] + 1
+                        queue[qtail] = v
+                        qtail += 1
+                    e = nxt[e]
+            if level[sink] == -1:
+                # Sink unreachable; the flow is maximal
+                break
+
+            for i in range(n):
+                iter_ptr[i] = head[i]
+
+            # Blocking flow: walk the level graph with an explicit stack
+            depth = 0
+            u = source
+            while True:
+                if u == sink:
+                    # Augment along the stacked edges by their bottleneck
+                    path_flow = cap[path[0]]
+                    for i in range(depth):
+                        if cap[path[i]] < path_flow:
+                            path_flow = cap[path[i]]
+                    for i in range(depth):
+                        cap[path[i]] -= path_flow
+                        cap[path[i] ^ 1] += path_flow
+                    max_flow += path_flow
+                    # Retreat to just before the first saturated edge
+                    i = 0
+                    while i < depth and cap[path[i]] > 0:
+                        i += 1
+                    depth = i
+                    u = to[path[i - 1]] if i > 0 else source
+                    continue
+
+                # Advance along the current arc if it is admissible
+                e = iter_ptr[u]
+                advanced = False
+                while e != -1:
+                    v = to[e]
+                    if cap[e] > 0 and level[v] == level[u] + 1:
+                        path[depth] = e
+                        depth += 1
+                        u = v
+                        advanced = True
+                        break
+                    e = nxt[e]
+                    iter_ptr[u] = e
+                if not advanced:
+                    if u == source:
+                        # Level graph is saturated; next phase
+                        break
+                    # Dead end: drop u from this phase and step back
+                    level[u] = -1
+                    depth -= 1
+                    e = path[depth]
+                    u = to[e ^ 1]
+                    iter_ptr[u] = nxt[e]
+
+        return max_flow
 
 
 def edmonds_karp(capacity, source, sink):
@@ -41,62 +249,333 @@ def edmonds_karp(capacity, source, sink):
     Corresponds directly to pseudocode Steps 1–3.
     """
     n = len(capacity)
-    # (Step 1) Initialize all flows to zero by copying the initial capacity matrix
-    residual = [row[:] for row in capacity]
-    parent = [-1] * n
-    max_flow = 0  # Total flow pushed so far
-
+    if not (0 <= source < n and 0 <= sink < n):
+        # The compiled kernel runs without bounds checks, so reject bad
+        # indices here the same way the pure-Python path's lists would
+        raise IndexError("source and sink must be valid node indices")
+    # (Step 1) Build the residual graph once from the capacity matrix
+    head, nxt, to, cap = build_residual_arrays(capacity)
+
+    # Capacity scaling: only admit edges with residual >= delta and halve
+    # delta down from the largest power of two under the biggest capacity.
+    # Big augmentations happen first, cutting the number of phases to
+    # O(E log U) instead of O(VE) when capacities span many magnitudes;
+    # the final delta=1 sweep is the ordinary algorithm, so the answer is
+    # exact
+    biggest = max(max(row) for row in capacity)
+    delta = 1 << (biggest.bit_length() - 1) if biggest > 0 else 1
+
+    if _HAVE_NUMBA:
+        # Hand the flat edge arrays to the compiled kernel, one call per
+        # Δ-threshold against the same in-place residual capacities
+        head_arr = np.array(head, dtype=np.int64)
+        nxt_arr = np.array(nxt, dtype=np.int64)
+        to_arr = np.array(to, dtype=np.int64)
+        cap_arr = np.array(cap, dtype=np.int64)
+        max_flow = 0
+        while delta >= 1:
+            max_flow += int(_ek_core(head_arr, nxt_arr, to_arr, cap_arr,
+                                     source, sink, delta))
+            delta >>= 1
+        return max_flow
+
+    # (Steps 2–3) The whole augmenting loop lives in the Cython-annotated
+    # core module, which runs interpreted here or compiled when built
+    return edmonds_karp_core(head, nxt, to, cap, source, sink, delta)
+
+
+def dinic(capacity, source, sink):
+    """
+    Dinic's blocking-flow algorithm, an alternative to edmonds_karp.
 
-    # (Step 2) Repeat until no augmenting path remains
-    while bfs(residual, source, sink, parent):
-        # (Step 2d) Determine bottleneck capacity on the found path
-        path_flow = float('inf')
-        v = sink
-        while v != source:
-            u = parent[v]
-            path_flow = min(path_flow, residual[u][v])
-            v = u
+    Instead of redoing a full BFS for every single augmenting path, one BFS
+    assigns each node its distance from the source (the "level graph"), and
+    then a DFS pushes flow along *every* augmenting path inside that level
+    graph before the next BFS — O(V²E) overall versus O(VE²), and much
+    faster in practice.
+    """
+    if source == sink:
+        # mirror edmonds_karp: no augmenting path from a node to itself
+        return 0
 
+    n = len(capacity)
+    if not (0 <= source < n and 0 <= sink < n):
+        # same contract as edmonds_karp; the compiled kernel skips checks
+        raise IndexError("source and sink must be valid node indices")
+    head, nxt, to, cap = build_residual_arrays(capacity)
+
+    if _HAVE_NUMBA:
+        # Same phases, compiled: the iterative-DFS kernel also has no
+        # recursion-depth limit on very long augmenting paths
+        return int(_dinic_core(np.array(head, dtype=np.int64),
+                               np.array(nxt, dtype=np.int64),
+                               np.array(to, dtype=np.int64),
+                               np.array(cap, dtype=np.int64),
+                               source, sink))
+
+    level = [-1] * n
+    iter_ptr = [-1] * n  # per-node "current arc" into the edge lists
+
+    def bfs_levels():
+        # Label every reachable node with its BFS distance from the source;
+        # the sink staying unlabeled means no augmenting path is left
+        for i in range(n):
+            level[i] = -1
+        level[source] = 0
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            if level[sink] != -1 and level[u] >= level[sink]:
+                # BFS pops in level order, so everything still queued is at
+                # least as deep as the sink and can't sit on a shortest
+                # source→sink path — stop labeling early
+                break
+            e = head[u]
+            while e != -1:
+                v = to[e]
+                if cap[e] > 0 and level[v] == -1:
+                    level[v] = level[u] + 1
+                    queue.append(v)
+                e = nxt[e]
+        return level[sink] != -1
+
+    def blocking_flow():
+        # Saturate the level graph by walking it with an explicit edge
+        # stack (same shape as the compiled kernel): only edges that
+        # descend exactly one level are taken, the current-arc pointer is
+        # advanced past dead edges so each edge is looked at once per phase
+        # instead of once per path, and there is no recursion to limit how
+        # long an augmenting path may get
+        flow_pushed = 0
+        path = []  # edge ids on the current partial path
+        u = source
+        while True:
+            if u == sink:
+                # Augment along the stacked edges by their bottleneck
+                path_flow = cap[path[0]]
+                for e in path:
+                    if cap[e] < path_flow:
+                        path_flow = cap[e]
+                for e in path:
+                    cap[e] -= path_flow
+                    cap[e ^ 1] += path_flow
+                flow_pushed += path_flow
+                # Retreat to just before the first saturated edge
+                i = 0
+                while i < len(path) and cap[path[i]] > 0:
+                    i += 1
+                del path[i:]
+                u = to[path[-1]] if path else source
+                continue
+
+            # Advance along the current arc if it is admissible
+            e = iter_ptr[u]
+            advanced = False
+            while e != -1:
+                v = to[e]
+                if cap[e] > 0 and level[v] == level[u] + 1:
+                    path.append(e)
+                    u = v
+                    advanced = True
+                    break
+                e = nxt[e]
+                iter_ptr[u] = e
+            if not advanced:
+                if u == source:
+                    # Level graph is saturated; this phase is done
+                    return flow_pushed
+                # Dead end: drop u from this phase and step back
+                level[u] = -1
+                e = path.pop()
+                u = to[e ^ 1]
+                iter_ptr[u] = nxt[e]
+
+    max_flow = 0
+    # Each outer iteration is one phase: relevel, then saturate the level
+    # graph with as many augmenting paths as it can carry (a blocking flow)
+    while bfs_levels():
+        for i in range(n):
+            iter_ptr[i] = head[i]
+        max_flow += blocking_flow()
+    return max_flow
 
-        # (Step 2e) Augment flow along the path by the bottleneck amount
-        v = sink
-        while v != source:
-            u = parent[v]
-            residual[u][v] -= path_flow  # reduce forward edge capacity
-            residual[v][u] += path_flow  # increase reverse edge (undo flow) capacity
-            v = u
 
+def push_relabel(capacity, source, sink):
+    """
+    Push-relabel maximum flow, highest-label rule with the gap heuristic.
+
+    A different family from the augmenting-path methods above: instead of
+    finding whole source→sink paths, every node may hold temporary excess,
+    which gets pushed one edge at a time "downhill" along admissible edges
+    (height difference exactly 1); a node with excess but no admissible
+    edge is relabeled just high enough to create one. Always discharging
+    the highest active node gives O(V²√E), and the gap heuristic retires
+    whole height ranges that can no longer reach the sink — in practice the
+    fastest serial method on dense or capacity-heavy graphs.
+    """
+    if source == sink:
+        # mirror edmonds_karp: no flow from a node to itself
+        return 0
 
-        # Accumulate total flow
-        max_flow += path_flow
+    n = len(capacity)
+    head, nxt, to, cap = build_residual_arrays(capacity)
+
+    excess = [0] * n
+    height = [0] * n
+    # Heights never need to exceed 2n, so bucket the active nodes by height
+    # and count how many nodes sit at each height (for gap detection)
+    buckets = [[] for _ in range(2 * n + 1)]
+    height_count = [0] * (2 * n + 1)
+    in_bucket = bytearray(n)
+    height[source] = n
+    height_count[0] = n - 1
+    height_count[n] = 1
+    highest = 0  # topmost height with an active node
+
+    def activate(v):
+        nonlocal highest
+        if v != source and v != sink and not in_bucket[v] and excess[v] > 0:
+            in_bucket[v] = 1
+            buckets[height[v]].append(v)
+            if height[v] > highest:
+                highest = height[v]
+
+    # Initialization: saturate every edge leaving the source
+    e = head[source]
+    while e != -1:
+        c = cap[e]
+        if c > 0:
+            v = to[e]
+            cap[e] = 0
+            cap[e ^ 1] += c
+            excess[v] += c
+            activate(v)
+        e = nxt[e]
+
+    while highest >= 0:
+        if not buckets[highest]:
+            highest -= 1
+            continue
+        u = buckets[highest].pop()
+        in_bucket[u] = 0
+
+        # Discharge u: push its excess along admissible edges, relabeling
+        # whenever the edges are exhausted, until the excess is gone
+        e = head[u]
+        while excess[u] > 0:
+            if e == -1:
+                # Relabel: lift u just above its lowest residual neighbor
+                old_h = height[u]
+                new_h = 2 * n
+                scan = head[u]
+                while scan != -1:
+                    if cap[scan] > 0 and height[to[scan]] + 1 < new_h:
+                        new_h = height[to[scan]] + 1
+                    scan = nxt[scan]
+                height_count[old_h] -= 1
+                if height_count[old_h] == 0 and 0 < old_h < n:
+                    # Gap heuristic: nobody is left at old_h, so nothing
+                    # above it can ever step down to the sink side again —
+                    # retire that whole range to n+1 in one sweep
+                    for w in range(n):
+                        if old_h < height[w] <= n and w != source:
+                            height_count[height[w]] -= 1
+                            height[w] = n + 1
+                            height_count[n + 1] += 1
+                    new_h = max(new_h, n + 1)
+                height[u] = new_h
+                height_count[new_h] += 1
+                if new_h >= 2 * n:
+                    # Nothing left to push against; remaining excess stays
+                    break
+                e = head[u]
+            else:
+                v = to[e]
+                if cap[e] > 0 and height[u] == height[v] + 1:
+                    # Push as much excess as the edge can take
+                    d = excess[u] if excess[u] < cap[e] else cap[e]
+                    cap[e] -= d
+                    cap[e ^ 1] += d
+                    excess[u] -= d
+                    excess[v] += d
+                    activate(v)
+                e = nxt[e]
+
+    # Everything that reached the sink is the maximum flow
+    return excess[sink]
+
+
+# The capacity matrix each worker process answers queries against. Set once
+# per worker by _init_worker so the graph crosses the process boundary a
+# single time instead of being pickled along with every query.
+_worker_capacity = None
+
+
+def _init_worker(capacity):
+    global _worker_capacity
+    _worker_capacity = capacity
+
+
+def _run_query(query):
+    source, sink = query
+    return edmonds_karp(_worker_capacity, source, sink)
+
+
+def max_flow_many(capacity, queries, workers=None):
+    """
+    Answer many independent (source, sink) max-flow queries on one graph.
 
+    Each query is completely independent of the others, so the work is
+    spread across worker processes. The graph is handed to every worker
+    exactly once (via the pool initializer); after that only the small
+    (source, sink) tuples and integer answers travel between processes.
+    Returns the list of max-flow values in query order.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(queries) <= 1:
+        # Not worth the process startup cost
+        return [edmonds_karp(capacity, s, t) for s, t in queries]
 
-    # (Step 3) Once no more paths exist, return the total maximum flow found
-    return max_flow
+    # Batch queries so each worker gets a few at a time instead of paying
+    # one inter-process round trip per query
+    chunksize = max(1, len(queries) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_worker,
+                             initargs=(capacity,)) as pool:
+        return list(pool.map(_run_query, queries, chunksize=chunksize))
 
 
 def read_graph():
     """
     Utility function to allow the user to input a custom graph.
     This doesn't directly map to pseudocode, but it's needed for testing the algorithm.
+
+    The whole of stdin is read and tokenized in one go rather than calling
+    input() once per line: for a big piped-in matrix that is one syscall and
+    one C-level split instead of n+3 prompts, which dominates startup when
+    the tool is driven from a file or another program.
     """
-    n = int(input("Enter the number of nodes in the network: "))
-    print("Great! Now enter the capacity matrix, one row per line.")
-    print(f"Each row should have {n} non-negative integers separated by spaces.")
+    print("Enter the number of nodes, then the capacity matrix (n rows of n")
+    print("non-negative integers), then the source and sink node indices.")
+    print("Finish with end-of-file (Ctrl-D).")
 
 
-    capacity = []
-    for i in range(n):
-        # Read each row of the capacity matrix
-        row = list(map(int, input(f"Row {i} → ").strip().split()))
-        if len(row) != n:
-            raise ValueError(f"Row {i} must have exactly {n} entries.")
-        capacity.append(row)
+    tokens = sys.stdin.buffer.read().split()
+    n = int(tokens[0]) if tokens else 0
+    if len(tokens) != 1 + n * n + 2:
+        raise ValueError(
+            f"Expected {1 + n * n + 2} integers for an {n}-node network "
+            f"(count, matrix, source, sink), got {len(tokens)}.")
+
+
+    it = iter(tokens[1:])
+    capacity = [[int(next(it)) for _ in range(n)] for _ in range(n)]
 
 
     # Define source and sink
-    source = int(input(f"Enter the source node index (0 to {n-1}): "))
-    sink = int(input(f"Enter the sink node index   (0 to {n-1}): "))
+    source = int(next(it))
+    sink = int(next(it))
 
 
     return capacity, source, sink
@@ -114,5 +593,3 @@ if __name__ == "__main__":
 
     # Output the result
     print(f"\nThe maximum possible flow from node {src} to node {dst} is: {maxflow}")
-
-
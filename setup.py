@@ -0,0 +1,29 @@
+"""
+Optional Cython build for the Edmonds-Karp hot loop.
+
+Everything runs as plain Python out of the box. To compile the annotated
+pure-Python-mode core (the same source file, no separate .pyx), set the
+environment variable and build in place:
+
+    ALGOCOMP_ENABLE_SPEEDUPS=1 python setup.py build_ext --inplace
+
+The resulting extension shadows _edmonds_karp_core.py under the same
+import, so code_no_plot.py picks it up with no code changes; delete the
+built .so/.pyd to go back to the interpreted version.
+"""
+
+import os
+
+from setuptools import setup
+
+if os.environ.get("ALGOCOMP_ENABLE_SPEEDUPS"):
+    from Cython.Build import cythonize
+    ext_modules = cythonize("_edmonds_karp_core.py", language_level=3)
+else:
+    ext_modules = []
+
+setup(
+    name="algocomp-iterativeimprov",
+    py_modules=["code_1", "code_no_plot", "_edmonds_karp_core"],
+    ext_modules=ext_modules,
+)